@@ -12,267 +12,438 @@ Dataset:
 NYC OpenData - Motor Vehicle Collisions: https://data.cityofnewyork.us/Public-Safety/Motor-Vehicle-Collisions-Crashes/h9gi-nx95
 
 Libraries Used:
-pandas, matplotlib, seaborn, folium, statsmodels
+pandas, polars, pyarrow, matplotlib, datashader, folium, statsmodels, joblib, numba
 """
 
 # -------------------------------------------------------------------
 # Import Libraries
 # -------------------------------------------------------------------
 
+import argparse
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
+import polars as pl
+import pyarrow as pa
+import pyarrow.csv as pv
+import pyarrow.parquet as pq
+import datashader as ds
+import datashader.transfer_functions as tf
+from colorcet import fire
 import folium
-from folium.plugins import HeatMap, MarkerCluster
+from folium.plugins import FastMarkerCluster
+from joblib import Memory
+from numba import njit
 from statsmodels.tsa.seasonal import seasonal_decompose
 
-# -------------------------------------------------------------------
-# Load Dataset
-# -------------------------------------------------------------------
-
-file_path = "Motor_Vehicle_Collisions_-_Crashes_20250127.csv"
-data = pd.read_csv(file_path, low_memory=False)
-
-print("Dataset loaded successfully.")
-print("Number of records:", len(data))
-print("Columns:", list(data.columns))
-
-# -------------------------------------------------------------------
-# Basic Data Overview
-# -------------------------------------------------------------------
-
-print("\nDataset Summary:")
-print(data.describe())
-
-# -------------------------------------------------------------------
-# Missing Value Analysis
-# -------------------------------------------------------------------
-
-missing_values = data.isnull().sum()
-missing_percentage = (missing_values / len(data)) * 100
-missing_data = pd.DataFrame({
-    'Missing Values': missing_values,
-    'Percentage': missing_percentage
-}).sort_values(by='Percentage', ascending=False)
-
-print("\nMissing Value Summary:")
-print(missing_data.head(10))
-
-# -------------------------------------------------------------------
-# Contributing Factors Analysis
-# -------------------------------------------------------------------
-
-top_factors = data['CONTRIBUTING FACTOR VEHICLE 1'].value_counts().head(10)
-
-plt.figure(figsize=(12, 7))
-sns.barplot(x=top_factors.values, y=top_factors.index, palette="magma")
-plt.title('Top 10 Contributing Factors to Crashes')
-plt.xlabel('Number of Crashes')
-plt.ylabel('Contributing Factor')
-plt.tight_layout()
-plt.show()
-
-# -------------------------------------------------------------------
-# Vehicle Type Analysis
-# -------------------------------------------------------------------
-
-top_vehicle_types = data['VEHICLE TYPE CODE 1'].value_counts().head(10)
-
-plt.figure(figsize=(12, 7))
-sns.barplot(x=top_vehicle_types.values, y=top_vehicle_types.index, palette="cividis")
-plt.title('Top 10 Vehicle Types Involved in Crashes')
-plt.xlabel('Number of Crashes')
-plt.ylabel('Vehicle Type')
-plt.tight_layout()
-plt.show()
+from charts import (
+    CHART_FILES,
+    plot_boroughs,
+    plot_contributing_factors,
+    plot_crash_types,
+    plot_crashes_per_hour,
+    plot_decomposition,
+    plot_monthly_crashes,
+    plot_vehicle_types,
+    plot_zip_codes
+)
 
 # -------------------------------------------------------------------
-# Crash Type Analysis (Injuries & Fatalities)
+# Configuration
 # -------------------------------------------------------------------
+# Every analysis below is an aggregation, so only the columns in use are
+# parsed (by PyArrow's multithreaded CSV reader, into compact Arrow types)
+# and cached as Parquet, so reruns skip CSV parsing entirely. The cache is
+# rebuilt whenever the CSV is newer than it; delete it by hand after
+# changing the column list below. Polars computes the aggregates from the
+# cache, and results are converted to pandas only for plotting and mapping.
 
-types_of_crashes = {
-    'Pedestrian Injuries': data['NUMBER OF PEDESTRIANS INJURED'].sum(),
-    'Cyclist Injuries': data['NUMBER OF CYCLIST INJURED'].sum(),
-    'Motorist Injuries': data['NUMBER OF MOTORIST INJURED'].sum(),
-    'Pedestrian Deaths': data['NUMBER OF PEDESTRIANS KILLED'].sum(),
-    'Cyclist Deaths': data['NUMBER OF CYCLIST KILLED'].sum(),
-    'Motorist Deaths': data['NUMBER OF MOTORIST KILLED'].sum()
+file_path = "Motor_Vehicle_Collisions_-_Crashes_20250127.csv"
+parquet_path = "collisions.parquet"
+cache_dir = ".cache"
+chart_workers = 2
+row_group_rows = 1_000_000
+heatmap_pixels = 1000
+
+CRASH_TYPE_COLUMNS = {
+    'Pedestrian Injuries': 'NUMBER OF PEDESTRIANS INJURED',
+    'Cyclist Injuries': 'NUMBER OF CYCLIST INJURED',
+    'Motorist Injuries': 'NUMBER OF MOTORIST INJURED',
+    'Pedestrian Deaths': 'NUMBER OF PEDESTRIANS KILLED',
+    'Cyclist Deaths': 'NUMBER OF CYCLIST KILLED',
+    'Motorist Deaths': 'NUMBER OF MOTORIST KILLED'
 }
-
-crash_types_df = pd.DataFrame(list(types_of_crashes.items()), columns=['Crash Type', 'Count'])
-
-plt.figure(figsize=(12, 7))
-sns.barplot(x='Count', y='Crash Type', data=crash_types_df, palette="mako")
-plt.title('Types of Crashes and Their Frequencies')
-plt.xlabel('Count')
-plt.ylabel('Type of Crash')
-plt.tight_layout()
-plt.show()
-
-# -------------------------------------------------------------------
-# Time Series Analysis - Crashes per Hour
-# -------------------------------------------------------------------
-
-data['CRASH DATE'] = pd.to_datetime(data['CRASH DATE'])
-data['CRASH TIME'] = pd.to_datetime(data['CRASH TIME'], format='%H:%M', errors='coerce')
-data['Hour of Day'] = data['CRASH TIME'].dt.hour
-
-crashes_per_hour = data.groupby('Hour of Day').size()
-
-plt.figure(figsize=(12, 6))
-sns.barplot(x=crashes_per_hour.index, y=crashes_per_hour.values, color='steelblue')
-plt.title('Average Number of Crashes per Hour of Day')
-plt.xlabel('Hour of Day')
-plt.ylabel('Number of Crashes')
-plt.xticks(range(0, 24))
-plt.tight_layout()
-plt.show()
-
-# -------------------------------------------------------------------
-# Monthly Crash Trend Analysis
-# -------------------------------------------------------------------
-
-monthly_crashes = data.groupby(data['CRASH DATE'].dt.to_period("M")).size()
-
-plt.figure(figsize=(15, 7))
-monthly_crashes.plot()
-plt.title('Number of Crashes per Month')
-plt.xlabel('Date')
-plt.ylabel('Number of Crashes')
-plt.tight_layout()
-plt.show()
-
-# -------------------------------------------------------------------
-# Daily Crash Trend and Decomposition
-# -------------------------------------------------------------------
-
-daily_crashes = data.groupby('CRASH DATE').size()
-decomposition = seasonal_decompose(daily_crashes, model='additive', period=365)
-
-fig, (ax1, ax2, ax3) = plt.subplots(3, 1, figsize=(15, 12))
-decomposition.trend.plot(ax=ax1)
-ax1.set_title('Trend')
-decomposition.seasonal.plot(ax=ax2)
-ax2.set_title('Seasonality')
-decomposition.resid.plot(ax=ax3)
-ax3.set_title('Residuals')
-plt.tight_layout()
-plt.show()
-
-# -------------------------------------------------------------------
-# Crashes by Borough
-# -------------------------------------------------------------------
-
-borough_count = data['BOROUGH'].value_counts()
-
-plt.figure(figsize=(12, 7))
-sns.barplot(x=borough_count.index, y=borough_count.values, palette="viridis")
-plt.title('Distribution of Crashes by Borough')
-plt.xlabel('Borough')
-plt.ylabel('Number of Crashes')
-plt.tight_layout()
-plt.show()
-
-# -------------------------------------------------------------------
-# Geospatial Heatmap of Crash Density
-# -------------------------------------------------------------------
-
-data_geo = data.dropna(subset=['LATITUDE', 'LONGITUDE'])
-heat_data = [[row['LATITUDE'], row['LONGITUDE']] for _, row in data_geo.iterrows()]
-
-m_heatmap = folium.Map(location=[40.730610, -73.935242], zoom_start=10)
-HeatMap(heat_data, radius=8, max_zoom=13).add_to(m_heatmap)
-m_heatmap.save("nyc_heatmap.html")
-
-print("Geospatial heatmap saved as 'nyc_heatmap.html'.")
-
-# -------------------------------------------------------------------
-# Severity Mapping
-# -------------------------------------------------------------------
-
-sample_data = data_geo.sample(n=1000, random_state=42)
-m_severity = folium.Map(location=[40.730610, -73.935242], zoom_start=10)
-
-for _, row in sample_data.iterrows():
-    if row['NUMBER OF PERSONS KILLED'] > 0:
-        folium.features.RegularPolygonMarker(
-            location=[row['LATITUDE'], row['LONGITUDE']],
-            number_of_sides=3,
-            radius=5,
-            color="red",
-            fill=True,
-            fill_color="red"
-        ).add_to(m_severity)
-    elif row['NUMBER OF PERSONS INJURED'] > 0:
-        folium.CircleMarker(
-            location=[row['LATITUDE'], row['LONGITUDE']],
-            radius=5,
-            color="orange",
-            fill=True,
-            fill_color="orange"
-        ).add_to(m_severity)
+INJURY_COLUMNS = [
+    'NUMBER OF PERSONS INJURED',
+    'NUMBER OF PERSONS KILLED',
+    *CRASH_TYPE_COLUMNS.values()
+]
+POINT_COLUMNS = [
+    'LATITUDE', 'LONGITUDE', 'NUMBER OF PERSONS INJURED', 'NUMBER OF PERSONS KILLED'
+]
+NYC_BOUNDS = [[40.49, 40.92], [-74.27, -73.68]]
+
+CATEGORY_COLUMNS = [
+    'BOROUGH', 'ZIP CODE', 'CONTRIBUTING FACTOR VEHICLE 1', 'VEHICLE TYPE CODE 1'
+]
+CATEGORY = pa.dictionary(pa.int32(), pa.string())
+COLUMN_TYPES = {
+    'CRASH DATE': pa.timestamp('s'),
+    'CRASH TIME': pa.string(),
+    'BOROUGH': CATEGORY,
+    'ZIP CODE': CATEGORY,
+    'LATITUDE': pa.float32(),
+    'LONGITUDE': pa.float32(),
+    'CONTRIBUTING FACTOR VEHICLE 1': CATEGORY,
+    'VEHICLE TYPE CODE 1': CATEGORY,
+    **dict.fromkeys(INJURY_COLUMNS, pa.uint16())
+}
+USE_COLUMNS = list(COLUMN_TYPES)
+
+# Marker class and style for each level returned by classify_severity().
+SEVERITY_MARKERS = [
+    (folium.features.RegularPolygonMarker, {'number_of_sides': 3, 'color': 'red', 'fill_color': 'red'}),
+    (folium.CircleMarker, {'color': 'orange', 'fill_color': 'orange'}),
+    (folium.features.RegularPolygonMarker, {'number_of_sides': 4, 'color': 'green', 'fill_color': 'green'})
+]
+
+# -------------------------------------------------------------------
+# Helpers
+# -------------------------------------------------------------------
+
+
+def value_counts(collisions, column):
+    """Crashes per non-null value of a column, most frequent first."""
+    return (
+        collisions.drop_nulls(column)
+        .group_by(column).len()
+        .with_columns(pl.col(column).cast(pl.String))
+        .sort('len', descending=True)
+    )
+
+
+def to_series(frame, key, value='len'):
+    """Convert a collected Polars aggregate into a pandas Series for plotting."""
+    return frame.to_pandas().set_index(key)[value]
+
+
+def null_counts(metadata):
+    """Nulls per column, summed from the Parquet row-group statistics.
+
+    Returns None if any column chunk was written without a null count.
+    """
+    counts = pd.Series(0, index=metadata.schema.names)
+    for i in range(metadata.num_row_groups):
+        row_group = metadata.row_group(i)
+        for j in range(row_group.num_columns):
+            column = row_group.column(j)
+            if not (column.is_stats_set and column.statistics.has_null_count):
+                return None
+            counts[column.path_in_schema] += column.statistics.null_count
+    return counts
+
+
+def cache_is_stale(cache_path, source_path):
+    """True if the cache is missing or older than its source file."""
+    if not os.path.exists(cache_path):
+        return True
+    return (
+        os.path.exists(source_path)
+        and os.path.getmtime(source_path) > os.path.getmtime(cache_path)
+    )
+
+
+@njit(cache=True)
+def classify_severity(killed, injured):
+    """Severity level per crash, indexing SEVERITY_MARKERS: fatal, injury, none."""
+    levels = np.empty(len(killed), np.int8)
+    for i in range(len(killed)):
+        if killed[i] > 0:
+            levels[i] = 0
+        elif injured[i] > 0:
+            levels[i] = 1
+        else:
+            levels[i] = 2
+    return levels
+
+
+# -------------------------------------------------------------------
+# Maps
+# -------------------------------------------------------------------
+
+
+def geo_section(path):
+    """Build the heatmap, severity and cluster maps from the Parquet cache.
+
+    Only the coordinate and injury/fatality columns are read, as float32
+    and uint16, so the maps do not depend on the aggregation pass.
+    """
+    # Only geocoded crashes reach the maps, and blank counts count as zero.
+    data_geo = (
+        pl.scan_parquet(path)
+        .select(POINT_COLUMNS)
+        .drop_nulls(['LATITUDE', 'LONGITUDE'])
+        .with_columns(
+            pl.col('NUMBER OF PERSONS INJURED', 'NUMBER OF PERSONS KILLED').fill_null(0)
+        )
+        .collect()
+        .to_pandas()
+    )
+
+    # ---------------------------------------------------------------
+    # Geospatial Heatmap of Crash Density
+    # ---------------------------------------------------------------
+
+    # Datashader rasterizes every crash onto a fixed canvas over the city and
+    # the shaded image is overlaid on the map, so the HTML carries one PNG
+    # instead of the points. Mis-geocoded points (e.g. 0, 0) fall outside
+    # NYC_BOUNDS and are dropped.
+    (lat_min, lat_max), (lon_min, lon_max) = NYC_BOUNDS
+    canvas = ds.Canvas(
+        plot_width=heatmap_pixels, plot_height=heatmap_pixels,
+        x_range=(lon_min, lon_max), y_range=(lat_min, lat_max)
+    )
+    crash_density = canvas.points(data_geo, 'LONGITUDE', 'LATITUDE')
+    tf.shade(crash_density, cmap=fire).to_pil().save("nyc_heatmap.png")
+
+    m_heatmap = folium.Map(location=[40.730610, -73.935242], zoom_start=10)
+    folium.raster_layers.ImageOverlay(
+        "nyc_heatmap.png", bounds=[[lat_min, lon_min], [lat_max, lon_max]], opacity=0.8
+    ).add_to(m_heatmap)
+    m_heatmap.save("nyc_heatmap.html")
+
+    print("Geospatial heatmap saved as 'nyc_heatmap.html'.")
+
+    # ---------------------------------------------------------------
+    # Severity Mapping
+    # ---------------------------------------------------------------
+
+    # The map samples draw row indices into plain coordinate arrays rather
+    # than sampling DataFrames.
+    rng = np.random.default_rng(42)
+    latlon = data_geo[['LATITUDE', 'LONGITUDE']].to_numpy(dtype=np.float32)
+
+    sample_idx = rng.choice(len(latlon), 1000, replace=False)
+    m_severity = folium.Map(location=[40.730610, -73.935242], zoom_start=10)
+
+    severity = classify_severity(
+        data_geo['NUMBER OF PERSONS KILLED'].to_numpy()[sample_idx],
+        data_geo['NUMBER OF PERSONS INJURED'].to_numpy()[sample_idx]
+    )
+
+    # Sampled float32 coordinates are widened and rounded to 6 decimals
+    # (about 0.1 m), so the HTML does not carry float32 conversion noise.
+    severity_points = np.round(latlon[sample_idx].astype(np.float64), 6)
+
+    for (lat, lon), level in zip(severity_points.tolist(), severity.tolist()):
+        marker, style = SEVERITY_MARKERS[level]
+        marker(location=[lat, lon], radius=5, fill=True, **style).add_to(m_severity)
+
+    m_severity.save("severity_map.html")
+    print("Severity map saved as 'severity_map.html'.")
+
+    # ---------------------------------------------------------------
+    # Interactive Map with Marker Clusters
+    # ---------------------------------------------------------------
+
+    sample_points = np.round(
+        latlon[rng.choice(len(latlon), 5000, replace=False)].astype(np.float64), 6
+    )
+
+    # FastMarkerCluster ships the coordinates as one array and builds the
+    # markers in the browser; the callback keeps the coordinate popup.
+    marker_callback = """
+    function (row) {
+        var marker = L.marker(new L.LatLng(row[0], row[1]));
+        marker.bindPopup('Lat: ' + row[0] + ', Lon: ' + row[1]);
+        return marker;
+    }
+    """
+
+    m_cluster = folium.Map(location=[40.730610, -73.935242], zoom_start=10)
+    FastMarkerCluster(sample_points.tolist(), callback=marker_callback).add_to(m_cluster)
+
+    m_cluster.save('nyc_crash_map.html')
+    print("Cluster map saved as 'nyc_crash_map.html'.")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Analyze NYC motor vehicle collisions.")
+    parser.add_argument(
+        '--verbose', action='store_true',
+        help="print summary statistics for the coordinate and injury/fatality columns"
+    )
+    return parser.parse_args()
+
+
+def main(args):
+    # ---------------------------------------------------------------
+    # Load Dataset
+    # ---------------------------------------------------------------
+
+    # The first run parses the CSV with PyArrow's multithreaded reader. Only
+    # the used columns are converted, into compact types, so the whole table
+    # is small enough to hold in memory. It is written in row groups of
+    # row_group_rows, under a temporary name so an interrupted conversion is
+    # not mistaken for a cache. A replaced or re-downloaded CSV (newer than
+    # the cache) triggers a rebuild, so stale data is never reused.
+    if cache_is_stale(parquet_path, file_path):
+        table = pv.read_csv(
+            file_path,
+            convert_options=pv.ConvertOptions(
+                include_columns=USE_COLUMNS,
+                column_types=COLUMN_TYPES,
+                timestamp_parsers=['%m/%d/%Y'],
+                strings_can_be_null=True
+            )
+        )
+        pq.write_table(
+            table, parquet_path + ".tmp", compression='zstd', row_group_size=row_group_rows
+        )
+        os.replace(parquet_path + ".tmp", parquet_path)
+
+    collisions = pl.scan_parquet(parquet_path).with_columns(
+        pl.col(CATEGORY_COLUMNS).cast(pl.Categorical)
+    )
+
+    # CRASH TIME is H:MM or HH:MM, so the hour is whatever precedes the colon.
+    hour_of_day = (
+        pl.col('CRASH TIME').str.split(':').list.first()
+        .cast(pl.Int8, strict=False).alias('Hour of Day')
+    )
+
+    # All aggregations are planned lazily and collected together, so Polars
+    # runs them in parallel over a single projected scan of the Parquet file.
+    aggregations = {
+        'factors': value_counts(collisions, 'CONTRIBUTING FACTOR VEHICLE 1').head(10),
+        'vehicles': value_counts(collisions, 'VEHICLE TYPE CODE 1').head(10),
+        'boroughs': value_counts(collisions, 'BOROUGH'),
+        'crash_types': collisions.select(pl.col(list(CRASH_TYPE_COLUMNS.values())).sum()),
+        'hourly': collisions.group_by(hour_of_day).len().drop_nulls().sort('Hour of Day'),
+        'daily': collisions.group_by('CRASH DATE').len().drop_nulls().sort('CRASH DATE'),
+        'zip_codes': (
+            collisions.drop_nulls('ZIP CODE')
+            .group_by(pl.col('ZIP CODE').cast(pl.String))
+            .agg(pl.col('NUMBER OF PERSONS INJURED', 'NUMBER OF PERSONS KILLED').sum())
+        ),
+    }
+    results = dict(zip(aggregations, pl.collect_all(aggregations.values())))
+
+    # Row and null counts come from the Parquet footer, without reading data.
+    metadata = pq.read_metadata(parquet_path)
+    n_records = metadata.num_rows
+
+    print("Dataset loaded successfully.")
+    print("Number of records:", n_records)
+    print("Columns:", USE_COLUMNS)
+
+    # ---------------------------------------------------------------
+    # Basic Data Overview
+    # ---------------------------------------------------------------
+
+    # Quartiles need a sort per column, so the summary is opt-in.
+    if args.verbose:
+        print("\nDataset Summary:")
+        print(collisions.select(POINT_COLUMNS).describe())
+
+    # ---------------------------------------------------------------
+    # Missing Value Analysis
+    # ---------------------------------------------------------------
+
+    missing_values = null_counts(metadata)
+    if missing_values is None:
+        missing_values = collisions.null_count().collect().to_pandas().iloc[0]
+    missing_percentage = missing_values * (100.0 / n_records)
+    missing_data = pd.DataFrame({
+        'Missing Values': missing_values,
+        'Percentage': missing_percentage
+    }).sort_values(by='Percentage', ascending=False)
+
+    print("\nMissing Value Summary:")
+    print(missing_data.head(10))
+
+    # ---------------------------------------------------------------
+    # Chart Data
+    # ---------------------------------------------------------------
+
+    top_factors = to_series(results['factors'], 'CONTRIBUTING FACTOR VEHICLE 1')
+    top_vehicle_types = to_series(results['vehicles'], 'VEHICLE TYPE CODE 1')
+
+    crash_type_totals = results['crash_types'].to_pandas().iloc[0]
+    crash_type_totals.index = list(CRASH_TYPE_COLUMNS)
+    crash_types_df = crash_type_totals.rename_axis('Crash Type').reset_index(name='Count')
+
+    crashes_per_hour = to_series(results['hourly'], 'Hour of Day')
+
+    # Reindex to a continuous daily range (days without crashes count as zero)
+    # and cache the decomposition on disk, so reruns on the same data skip it.
+    daily_crashes = to_series(results['daily'], 'CRASH DATE').asfreq('D', fill_value=0)
+    seasonal_decompose_cached = Memory(cache_dir, verbose=0).cache(seasonal_decompose)
+    decomposition = seasonal_decompose_cached(daily_crashes, model='additive', period=365)
+    decomposition_components = pd.DataFrame({
+        'Trend': decomposition.trend,
+        'Seasonality': decomposition.seasonal,
+        'Residuals': decomposition.resid
+    })
+
+    # Monthly totals are rolled up from the daily counts instead of grouping
+    # every crash by month a second time.
+    monthly_crashes = daily_crashes.resample('MS').sum()
+
+    borough_count = to_series(results['boroughs'], 'BOROUGH')
+
+    zip_code_data = results['zip_codes'].to_pandas()
+    zip_code_data['CRASH_COUNT'] = (
+        zip_code_data['NUMBER OF PERSONS INJURED'] + zip_code_data['NUMBER OF PERSONS KILLED']
+    )
+    top_zip_codes = zip_code_data.sort_values('CRASH_COUNT', ascending=False).head(10)
+
+    charts = [
+        (plot_contributing_factors, top_factors),
+        (plot_vehicle_types, top_vehicle_types),
+        (plot_crash_types, crash_types_df),
+        (plot_crashes_per_hour, crashes_per_hour),
+        (plot_monthly_crashes, monthly_crashes),
+        (plot_decomposition, decomposition_components),
+        (plot_boroughs, borough_count),
+        (plot_zip_codes, top_zip_codes)
+    ]
+
+    # Drawing all charts takes only about a second, so the pool exists to
+    # render them while geo_section() builds the maps, not to spread them
+    # across every core. Each spawned worker re-imports this script and its
+    # analysis libraries before it can draw, so the pool is capped at
+    # chart_workers and leaves a core for the maps. On a single CPU the
+    # charts are drawn in this process instead. Workers are spawned rather
+    # than forked because Polars' thread pool is not fork-safe.
+    n_workers = min(chart_workers, len(charts), (os.cpu_count() or 1) - 1)
+    if n_workers > 0:
+        with ProcessPoolExecutor(
+            max_workers=n_workers, mp_context=multiprocessing.get_context('spawn')
+        ) as executor:
+            chart_futures = [executor.submit(plot, chart_data) for plot, chart_data in charts]
+            geo_section(parquet_path)
+            for future in chart_futures:
+                future.result()
     else:
-        folium.features.RegularPolygonMarker(
-            location=[row['LATITUDE'], row['LONGITUDE']],
-            number_of_sides=4,
-            radius=5,
-            color="green",
-            fill=True,
-            fill_color="green"
-        ).add_to(m_severity)
-
-m_severity.save("severity_map.html")
-print("Severity map saved as 'severity_map.html'.")
-
-# -------------------------------------------------------------------
-# ZIP Code-Based Crash Analysis
-# -------------------------------------------------------------------
+        geo_section(parquet_path)
+        for plot, chart_data in charts:
+            plot(chart_data)
 
-zip_code_data = data.groupby('ZIP CODE').agg({
-    'NUMBER OF PERSONS INJURED': 'sum',
-    'NUMBER OF PERSONS KILLED': 'sum'
-}).reset_index()
+    # ---------------------------------------------------------------
+    # End of Project
+    # ---------------------------------------------------------------
 
-zip_code_data['CRASH_COUNT'] = (
-    zip_code_data['NUMBER OF PERSONS INJURED'] + zip_code_data['NUMBER OF PERSONS KILLED']
-)
-
-plt.figure(figsize=(12, 8))
-sns.barplot(
-    data=zip_code_data.sort_values('CRASH_COUNT', ascending=False).head(10),
-    x='ZIP CODE', y='CRASH_COUNT', palette='viridis'
-)
-plt.title('Top 10 ZIP Codes by Number of Crashes')
-plt.xlabel('ZIP Code')
-plt.ylabel('Number of Crashes')
-plt.xticks(rotation=45)
-plt.tight_layout()
-plt.show()
+    print("\nAnalysis complete. Generated visualizations and maps are saved as:")
+    for chart_file in CHART_FILES:
+        print("-", chart_file)
+    print("- nyc_heatmap.html (with nyc_heatmap.png)")
+    print("- severity_map.html")
+    print("- nyc_crash_map.html")
 
-# -------------------------------------------------------------------
-# Interactive Map with Marker Clusters
-# -------------------------------------------------------------------
-
-data_filtered = data[['LATITUDE', 'LONGITUDE']].dropna()
-sample_points = data_filtered.sample(n=5000, random_state=42)
-
-m_cluster = folium.Map(location=[40.730610, -73.935242], zoom_start=10)
-marker_cluster = MarkerCluster().add_to(m_cluster)
-
-for _, row in sample_points.iterrows():
-    folium.Marker(
-        location=[row['LATITUDE'], row['LONGITUDE']],
-        popup=f"Lat: {row['LATITUDE']}, Lon: {row['LONGITUDE']}"
-    ).add_to(marker_cluster)
-
-m_cluster.save('nyc_crash_map.html')
-print("Cluster map saved as 'nyc_crash_map.html'.")
-
-# -------------------------------------------------------------------
-# End of Project
-# -------------------------------------------------------------------
 
-print("\nAnalysis complete. Generated visualizations and maps are saved as:")
-print("- nyc_heatmap.html")
-print("- severity_map.html")
-print("- nyc_crash_map.html")
+if __name__ == "__main__":
+    main(parse_args())
@@ -0,0 +1,126 @@
+"""
+Charts for the NYC Motor Vehicle Collisions analysis.
+
+Each chart takes its precomputed aggregate (pandas objects, no
+statsmodels or Polars types) and saves itself to PNG with the Agg
+backend, so charts can be drawn in any process. The module itself only
+needs Matplotlib and NumPy.
+"""
+
+import matplotlib
+matplotlib.use('Agg')
+
+import matplotlib.pyplot as plt
+import numpy as np
+
+
+def palette(name, n):
+    """n evenly spaced colours from a Matplotlib colormap."""
+    return plt.get_cmap(name)(np.linspace(0.15, 0.85, n))
+
+
+def plot_contributing_factors(top_factors):
+    fig, ax = plt.subplots(figsize=(12, 7))
+    # Reversed so the most frequent factor is drawn at the top.
+    ax.barh(top_factors.index[::-1], top_factors.values[::-1],
+            color=palette('magma', len(top_factors))[::-1])
+    ax.set_title('Top 10 Contributing Factors to Crashes')
+    ax.set_xlabel('Number of Crashes')
+    ax.set_ylabel('Contributing Factor')
+    fig.tight_layout()
+    fig.savefig('contributing_factors.png')
+    plt.close(fig)
+
+
+def plot_vehicle_types(top_vehicle_types):
+    fig, ax = plt.subplots(figsize=(12, 7))
+    ax.barh(top_vehicle_types.index[::-1], top_vehicle_types.values[::-1],
+            color=palette('cividis', len(top_vehicle_types))[::-1])
+    ax.set_title('Top 10 Vehicle Types Involved in Crashes')
+    ax.set_xlabel('Number of Crashes')
+    ax.set_ylabel('Vehicle Type')
+    fig.tight_layout()
+    fig.savefig('vehicle_types.png')
+    plt.close(fig)
+
+
+def plot_crash_types(crash_types_df):
+    fig, ax = plt.subplots(figsize=(12, 7))
+    ax.barh(crash_types_df['Crash Type'][::-1], crash_types_df['Count'][::-1],
+            color=palette('YlGnBu_r', len(crash_types_df))[::-1])
+    ax.set_title('Types of Crashes and Their Frequencies')
+    ax.set_xlabel('Count')
+    ax.set_ylabel('Type of Crash')
+    fig.tight_layout()
+    fig.savefig('crash_types.png')
+    plt.close(fig)
+
+
+def plot_crashes_per_hour(crashes_per_hour):
+    fig, ax = plt.subplots(figsize=(12, 6))
+    ax.bar(crashes_per_hour.index, crashes_per_hour.values, color='steelblue')
+    ax.set_title('Average Number of Crashes per Hour of Day')
+    ax.set_xlabel('Hour of Day')
+    ax.set_ylabel('Number of Crashes')
+    ax.set_xticks(range(0, 24))
+    fig.tight_layout()
+    fig.savefig('crashes_per_hour.png')
+    plt.close(fig)
+
+
+def plot_monthly_crashes(monthly_crashes):
+    plt.figure(figsize=(15, 7))
+    monthly_crashes.plot()
+    plt.title('Number of Crashes per Month')
+    plt.xlabel('Date')
+    plt.ylabel('Number of Crashes')
+    plt.tight_layout()
+    plt.savefig('monthly_crashes.png')
+    plt.close()
+
+
+def plot_decomposition(components):
+    fig, axes = plt.subplots(3, 1, figsize=(15, 12))
+    for ax, (title, component) in zip(axes, components.items()):
+        component.plot(ax=ax)
+        ax.set_title(title)
+    plt.tight_layout()
+    fig.savefig('daily_decomposition.png')
+    plt.close(fig)
+
+
+def plot_boroughs(borough_count):
+    fig, ax = plt.subplots(figsize=(12, 7))
+    ax.bar(borough_count.index, borough_count.values,
+           color=palette('viridis', len(borough_count)))
+    ax.set_title('Distribution of Crashes by Borough')
+    ax.set_xlabel('Borough')
+    ax.set_ylabel('Number of Crashes')
+    fig.tight_layout()
+    fig.savefig('boroughs.png')
+    plt.close(fig)
+
+
+def plot_zip_codes(top_zip_codes):
+    fig, ax = plt.subplots(figsize=(12, 8))
+    ax.bar(top_zip_codes['ZIP CODE'], top_zip_codes['CRASH_COUNT'],
+           color=palette('viridis', len(top_zip_codes)))
+    ax.set_title('Top 10 ZIP Codes by Number of Crashes')
+    ax.set_xlabel('ZIP Code')
+    ax.set_ylabel('Number of Crashes')
+    ax.tick_params(axis='x', labelrotation=45)
+    fig.tight_layout()
+    fig.savefig('zip_codes.png')
+    plt.close(fig)
+
+
+CHART_FILES = [
+    'contributing_factors.png',
+    'vehicle_types.png',
+    'crash_types.png',
+    'crashes_per_hour.png',
+    'monthly_crashes.png',
+    'daily_decomposition.png',
+    'boroughs.png',
+    'zip_codes.png'
+]